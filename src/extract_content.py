@@ -1,8 +1,30 @@
 import dataclasses
 import enum
+import functools
 import re
 
-from typing import ClassVar
+from typing import ClassVar, Optional
+
+# Literal markers equivalent to the default regex markers, used to scan for
+# the description with plain string searches instead of the regex engine
+_LITERAL_START_MARKER = '### Description'
+_LITERAL_END_MARKER = '###'
+
+# A start marker without any of these is a plain string, which must appear
+# in the text for the pattern to have any chance of matching
+_REGEX_SPECIAL_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_pattern(start_marker: str,
+                     content_pattern: str,
+                     end_marker: str) -> re.Pattern[str]:
+    pattern_str = ''.join((
+        f'{start_marker}',
+        f'{content_pattern}'
+        f'{end_marker}',
+    ))
+    return re.compile(pattern_str)
 
 
 @dataclasses.dataclass
@@ -17,15 +39,32 @@ class Config:
     content_pattern: str = Defaults.CONTENT_PATTERN.value
 
     def __post_init__(self):
-        self.pattern_str = ''.join((
-            f'{self.start_marker}',
-            f'{self.content_pattern}'
-            f'{self.end_marker}',
-        ))
-        self.pattern = re.compile(self.pattern_str)
+        # Configs with the same markers share a single compiled pattern
+        self.pattern = _compile_pattern(self.start_marker,
+                                        self.content_pattern,
+                                        self.end_marker)
+        self.pattern_str = self.pattern.pattern
+
+        # Default markers can be matched without the regex engine
+        self._fast = (
+            self.start_marker == self.Defaults.START_MARKER.value
+            and self.end_marker == self.Defaults.END_MARKER.value
+            and self.content_pattern == self.Defaults.CONTENT_PATTERN.value
+        )
+
+        self._prefilter: Optional[str] = None
+        if not _REGEX_SPECIAL_CHARS.intersection(self.start_marker):
+            self._prefilter = self.start_marker
 
 
 def extract_content(config: Config, text: str) -> str:
+    if config._fast:
+        return _extract_literal(text)
+
+    # Cheaply reject text that cannot contain the start marker
+    if config._prefilter is not None and config._prefilter not in text:
+        raise ValueError('No match found')
+
     pattern = config.pattern
 
     match = pattern.search(text)
@@ -34,3 +73,57 @@ def extract_content(config: Config, text: str) -> str:
         raise ValueError('No match found')
 
     return match.group(1).strip()
+
+
+def _extract_literal(text: str) -> str:
+    # Matches exactly what the default pattern matches, which is
+    #   \s?### Description\s\s*\n\s*([\s\S]*?)\s*\n\s*\s###
+    # The start marker must be followed by whitespace containing a newline
+    # (after its first character), and the content ends at the first "###"
+    # preceded by whitespace containing a newline (before its last character)
+    start = text.find(_LITERAL_START_MARKER)
+
+    while start >= 0:
+        header_end = start + len(_LITERAL_START_MARKER)
+
+        # Skip the whitespace after the start marker
+        content_start = len(text) - len(text[header_end:].lstrip())
+        newline = text.find('\n', header_end + 1, content_start)
+
+        if newline >= 0:
+            end = _find_end_marker(text, content_start)
+            if end >= 0:
+                return text[content_start:end].strip()
+
+            # The whitespace after the start marker can also end the content
+            # when it is directly followed by the end marker. The pattern
+            # only backtracks into that if there is no end marker after it
+            if (text.startswith(_LITERAL_END_MARKER, content_start)
+                    and '\n' in text[newline + 1:content_start - 1]):
+                return ''
+
+        # The pattern would try again at the next start marker
+        start = text.find(_LITERAL_START_MARKER, start + 1)
+
+    raise ValueError('No match found')
+
+
+def _find_end_marker(text: str, pos: int) -> int:
+    # Returns where the whitespace before a valid end marker begins, or -1
+    lower = pos
+    marker = text.find(_LITERAL_END_MARKER, pos)
+
+    while marker >= 0:
+        # Cheap check first, the marker has to directly follow whitespace
+        if marker > lower and text[marker - 1].isspace():
+            # The whitespace cannot extend back past the previous marker,
+            # so only that stretch of text needs stripping
+            run_start = lower + len(text[lower:marker].rstrip())
+
+            if '\n' in text[run_start:marker - 1]:
+                return run_start
+
+        lower = max(lower, marker + len(_LITERAL_END_MARKER))
+        marker = text.find(_LITERAL_END_MARKER, marker + 1)
+
+    return -1
@@ -1,6 +1,8 @@
 import dataclasses
+import itertools
 import warnings
-from typing import Callable, ClassVar, Iterable, Optional, Sequence
+from typing import (Callable, ClassVar, Iterable, Iterator, Optional,
+                    Sequence, TextIO)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -59,6 +61,8 @@ class Row(dict[str, str]):
             raise ValueError(f'Not a row: "{line}"')
 
         # Remove the first and last SEPARATOR chars (and whitespace)
+        # NOTE: MarkDownTable.genfromtxt_lines inlines this strip and split
+        # for well formed rows, keep the two in sync
         line = line.strip(config.sep).strip()
 
         # Split by separators to get column values
@@ -93,13 +97,9 @@ class Row(dict[str, str]):
 
             warnings.warn(msg)
 
-            # Set the missing column values to empty strings
-            diff = n_headers - n_values
-            for header in headers[-diff:]:
-                row[header] = ''  # empty string
-
-        # For the valid pairs of headers/values
-        for header, value in zip(headers, values):
+        # Missing column values are filled in as empty strings
+        for header, value in itertools.zip_longest(headers, values,
+                                                   fillvalue=''):
             row[header] = value.strip()
 
         return row
@@ -115,11 +115,16 @@ class Row(dict[str, str]):
         Returns:
             bool: True if the line is a valid row, False otherwise.
         """
-        # slice(None, 1) -> first character
-        # slice(-1, None) -> last character
-        # This is better than using indexes as this would not raise an
-        # index error given an empty string
-        return line[:1] == line[-1:] == config.sep
+        # startswith/endswith avoid allocating slices of the line, and
+        # unlike indexing would not raise an index error given an empty string
+        # The length check makes sure the opening and closing separators are
+        # not the same characters
+        # NOTE: MarkDownTable.genfromtxt_lines inlines this check, keep the
+        # two in sync
+        sep = config.sep
+        return (len(line) >= 2 * len(sep)
+                and line.startswith(sep)
+                and line.endswith(sep))
 
 
 class MarkDownTable(list[Row]):
@@ -134,6 +139,9 @@ class MarkDownTable(list[Row]):
         # self.rows: list[Row] = list()
         self.config = config
 
+        # Headers are immutable, so the set used to validate rows is as well
+        self._header_set: frozenset[str] = frozenset(self.headers)
+
     @staticmethod
     def get_headers(line: str,
                     config: MDConfig = MDConfig()) -> tuple[str, ...]:
@@ -209,16 +217,43 @@ class MarkDownTable(list[Row]):
         Raises:
             ValueError: If the text cannot be parsed as a valid Markdown table.
         """
-        # Ignore all surrounding whitespace
-        text = text.strip()
-
         # Newlines begin new rows in the table
-        # Use that to create an iterator over the lines
-        lines = enumerate(line.strip() for line in text.splitlines())
+        return cls.genfromtxt_lines(text.splitlines(),
+                                    headers=headers, config=config)
+
+    @classmethod
+    def genfromtxt_lines(cls, lines: Iterable[str],
+                         headers: Optional[Sequence[str]] = None,
+                         config: MDConfig = MDConfig()) -> 'MarkDownTable':
+        """Generate a MarkDownTable instance from lines of text.
+
+        Args:
+            lines (Iterable[str]): The lines of the Markdown table to parse.
+            headers (Optional[Sequence[str]]): Table headers.
+                If None, extracted from the first line.
+            config (MDConfig, optional): Configuration for parsing.
+
+        Returns:
+            MarkDownTable: A new MarkDownTable instance.
+
+        Raises:
+            ValueError: If the lines cannot be parsed as a valid Markdown table.
+        """
+        stripped = [line.strip() for line in lines]
+
+        # Ignore all surrounding blank lines
+        start, end = 0, len(stripped)
+        while start < end and not stripped[start]:
+            start += 1
+        while end > start and not stripped[end - 1]:
+            end -= 1
+
+        # Use the remaining lines to create an iterator over the rows
+        numbered = enumerate(stripped[start:end])
 
         # If headers were not given, use the first line as the header row
         if headers is None:
-            header_line: Optional[tuple[int, str]] = next(lines, None)
+            header_line: Optional[tuple[int, str]] = next(numbered, None)
             if header_line is None:
                 raise ValueError('The given text cannot be parsed as a table.')
 
@@ -227,7 +262,7 @@ class MarkDownTable(list[Row]):
 
         # Next line should be the header separator
         # We could ignore it, but verify it anyway
-        sep_line = next(lines, None)
+        sep_line = next(numbered, None)
         if sep_line is None:
             raise ValueError(
                 'Invalid markdown table.'
@@ -242,12 +277,36 @@ class MarkDownTable(list[Row]):
         # Instantiate a table
         table = cls(headers, config=config)
 
+        # Hoist attribute lookups out of the loop below
+        sep = config.sep
+        min_len = 2 * len(sep)
+        predicate = config.predicate
+        n_headers = len(headers)
+        append = table._append_trusted
+
         # Parse all remaining lines as table rows
-        for num, line in lines:
-            row = Row.genfromstr(headers=headers, line=line,
-                                 config=config, line_number=num)
-            if config.predicate(row):
-                table.append(row)
+        for num, line in numbered:
+            # Fast path for well formed rows, this is what Row.genfromstr
+            # does when every column has a value
+            # The check is Row.is_row, inlined to save a call per line
+            if (len(line) >= min_len
+                    and line.startswith(sep)
+                    and line.endswith(sep)):
+                values = line.strip(sep).strip().split(sep)
+            else:
+                values = []
+
+            row: Row
+            if len(values) == n_headers:
+                row = Row(zip(headers, map(str.strip, values)))
+            else:
+                # Let Row.genfromstr raise or warn about malformed rows
+                row = Row.genfromstr(headers=headers, line=line,
+                                     config=config, line_number=num)
+
+            # Rows built from our headers do not need to be validated
+            if predicate(row):
+                append(row)
 
         return table
 
@@ -255,27 +314,29 @@ class MarkDownTable(list[Row]):
         if not isinstance(row, Row):
             raise TypeError(f'Cannot append {type(row)}')
 
-        row_headers = set(row.keys())
-        our_headers = set(self.headers)
-
-        if not our_headers.issuperset(row_headers):
+        # dict_keys supports set comparisons without building a new set
+        if not row.keys() <= self._header_set:
+            our_headers = set(self.headers)
             raise ValueError(
                 f'Cannot add {row} because headers do not match {our_headers}'
             )
 
-        for hdr in our_headers.difference(row_headers):
-            row[hdr] = ''
+        if len(row) < len(self._header_set):
+            for hdr in self._header_set.difference(row.keys()):
+                row[hdr] = ''
+
+        super().append(row)
 
+    def _append_trusted(self, row: Row) -> None:
+        # Append a row known to have exactly our headers, skipping validation
         super().append(row)
 
     def extend(self, table: Iterable[Row]) -> None:
         if not isinstance(table, MarkDownTable):
             raise TypeError(f'Cannot extend {type(table)}')
 
-        row_headers = set(table.headers)
-        our_headers = set(self.headers)
-
-        if not our_headers == row_headers:
+        if not self._header_set == table._header_set:
+            our_headers = set(self.headers)
             raise ValueError(
                 f'Cannot add {table} because headers do not match {our_headers}'
             )
@@ -289,16 +350,11 @@ class MarkDownTable(list[Row]):
 
     def find(self,
              predicate: Callable[[Row], bool]) -> tuple[int, Optional[Row]]:
-        def f(args: tuple[int, Row]) -> bool:
-            # index, value = args
-            return predicate(args[1])
-
-        item = next(filter(f, enumerate(self)), None)
+        for idx, row in enumerate(self):
+            if predicate(row):
+                return (idx, row)
 
-        if item is None:
-            return (-1, None)
-
-        return item
+        return (-1, None)
 
     def __add__(self, other: 'MarkDownTable') -> 'MarkDownTable':  # type: ignore[override]
         obj = self.copy()
@@ -337,27 +393,55 @@ class MarkDownTable(list[Row]):
         Returns:
             str: A formatted string representation of the Markdown table.
         """
+        # Collect lines and join once, repeated concatenation is quadratic
+        lines = self._iter_lines(max_col_width=max_col_width,
+                                 justified=justified)
+        return '\n'.join(lines) + '\n'
+
+    def write_to(self, fp: TextIO, max_col_width: Optional[int] = None,
+                 justified: bool = False) -> None:
+        """
+        Write the table to a file object, one line at a time.
+
+        This produces the same output as `to_text`, without building the
+        whole string in memory first.
+
+        Args:
+            fp (TextIO): The file object to write to.
+            max_col_width (Optional[int]): Maximum column width.
+                If None, no limit is applied.
+            justified (bool, optional): If True, left justify text in columns.
+        """
+        for line in self._iter_lines(max_col_width=max_col_width,
+                                     justified=justified):
+            fp.write(line)
+            fp.write('\n')
+
+    def _iter_lines(self, max_col_width: Optional[int],
+                    justified: bool) -> Iterator[str]:
         headers = self.headers
         table = self
 
-        string = ''
-
         def truncate(text: str, max_width: int) -> str:
             if len(text) > max_width:
                 return text[:max_width - 3] + '...'
             else:
                 return text
 
+        # Gather the cells column by column, so each cell is looked up once
+        # and the rest of the rendering works on plain lists
+        columns = [[row[header] for row in table] for header in headers]
+
         # Calculate the maximum width for each column
         col_widths = {header: len(header) for header in headers}
 
-        if max_col_width is not None:
-            for row in table:
-                for header in headers:
-                    col_widths[header] = min(
-                        max_col_width,
-                        max(col_widths[header], len(row[header]))
-                    )
+        # Widths are only needed to truncate or to justify
+        if table and (max_col_width is not None or justified):
+            for header, column in zip(headers, columns):
+                width = max(col_widths[header], max(map(len, column)))
+                if max_col_width is not None:
+                    width = min(max_col_width, width)
+                col_widths[header] = width
 
         # Headers and separator line
         content: Iterable[str]
@@ -368,30 +452,35 @@ class MarkDownTable(list[Row]):
 
         header_row = f' {self.config.sep} '.join(content)
         header_row = f'| {header_row} |'
-        sep_row = ''.join(
-            char if char == self.config.sep else self.config.header_sep
-            for char in header_row
+        # Replace everything between the separators with the header separator
+        sep = self.config.sep
+        sep_row = sep.join(
+            self.config.header_sep * len(segment)
+            for segment in header_row.split(sep)
         )
-        sep_row = f'{sep_row}'
 
-        string += f"{header_row}\n{sep_row}\n"
+        yield header_row
+        yield sep_row
 
-        # Set all values to a very large number
-        if max_col_width is None:
-            col_widths = {header: 2 ** 32 for header in headers}
+        # Look up the widths once, rather than once per cell
+        widths = [col_widths[header] for header in headers]
 
         # The rows
-        for row in table:
-            content = (truncate(row[hdr], col_widths[hdr]) for hdr in headers)
+        for values in zip(*columns):
+            cells: Sequence[str] = values
 
-            if justified:
-                zipped = zip(content, headers)
-                content = map(lambda x: x[0].ljust(col_widths[x[1]]), zipped)
+            # Without a maximum width nothing is ever truncated
+            if max_col_width is not None:
+                cells = [
+                    truncate(value, width)
+                    for value, width in zip(values, widths)
+                ]
 
-            row_str = ' | '.join(content)
-            string += f'| {row_str} |\n'
+            if justified:
+                cells = [cell.ljust(width) for cell, width in zip(cells, widths)]
 
-        return string
+            row_str = ' | '.join(cells)
+            yield f'| {row_str} |'
 
 
 text = '''
@@ -2,10 +2,13 @@
 
 import argparse
 import datetime
+import functools
 import logging
+import os
 import pathlib
 import platform
 import re
+import shutil
 import sys
 
 from typing import Callable
@@ -26,6 +29,13 @@ except ImportError:
     from parse_md_table import MarkDownTable, Row
 
 
+# Matches the issue reference in the "Tracked by Issue" column, e.g. [#123]
+_ISSUE_RE = re.compile(r'\[#(\d+)\]')
+
+# Day of month without zero padding, the directive depends on the platform
+_DATE_FMT = '%e %b, %Y' if platform.system() == 'Windows' else '%-d %b, %Y'
+
+
 def add_create_args(create: argparse.ArgumentParser) -> None:
     # Add the --content flags
     create.add_argument('--content', '-c', type=str, required=True,
@@ -104,25 +114,41 @@ def parse_arguments() -> argparse.Namespace:
 
 def read_file(filepath: str | pathlib.Path) -> str:
     log.debug(f'Reading file: "{filepath}"')
-    with open(filepath) as f:
-        content = f.read()
+    return pathlib.Path(filepath).read_text()
+
 
-    return content
+def write_file(filepath: str | pathlib.Path,
+               keep: str,
+               table: MarkDownTable) -> None:
+    log.debug(f'Writing {len(table)} rows to file: "{filepath}"')
 
+    filepath = pathlib.Path(filepath)
+    tmp_path = filepath.with_name(f'.{filepath.name}.tmp')
 
-def write_file(filepath: str | pathlib.Path, content: str) -> None:
-    log.debug(f'Writing {len(content)} bytes to file: "{filepath}"')
+    # Stream the table to a temporary file instead of building the entire
+    # file contents in memory first, then move it into place once complete
+    # so that a failure part way through leaves the original file intact
+    try:
+        with open(tmp_path, 'w+') as f:
+            f.write(keep)
+            f.write('\n')
+            table.write_to(f)
 
-    with open(filepath, 'w+') as f:
-        f.write(content)
+        if filepath.exists():
+            shutil.copymode(filepath, tmp_path)
 
+        os.replace(tmp_path, filepath)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
+
+# Predicates only depend on the issue number, so they can be reused
+@functools.lru_cache(maxsize=256)
 def make_predicate(issue_number: int) -> Callable[[Row], bool]:
     log.debug(f'Making predicate for {issue_number = }')
-    pattern = re.compile(r'\[#(\d+)\]')
 
     def predicate(row: Row) -> bool:
-        match = pattern.match(row['Tracked by Issue'])
+        match = _ISSUE_RE.match(row['Tracked by Issue'])
 
         if match is None:
             return False
@@ -144,29 +170,25 @@ def add_user_story(table: MarkDownTable,
     idx, row = table.find(predicate)
 
     if row is not None:
-        new_table = MarkDownTable(headers=table.headers)
-        new_table.append(row)
+        # Only render the existing entry if the message will be shown
+        if log.isEnabledFor(logging.ERROR):
+            new_table = MarkDownTable(headers=table.headers)
+            new_table.append(row)
 
-        text = new_table.to_text()
+            text = new_table.to_text()
 
-        log.error(f'Issue number {issue_number} already exists.\n{text}')
+            log.error(f'Issue number {issue_number} already exists.\n{text}')
         sys.exit(1)
 
     # Collapse description into one line if it isn't already
     # Multiline text will break markdown tables
-    description = ' '.join(
+    description = ' '.join([
         desc if desc.endswith('.') else f'{desc}.'
         for desc in description.splitlines()
-    )
+    ])
     headers = table.headers
 
-    fmt_str: str
-    if platform.system() == 'Windows':
-        fmt_str = '%e %b, %Y'
-    else:
-        fmt_str = '%-d %b, %Y'
-
-    time_str = datetime.datetime.today().strftime(fmt_str)
+    time_str = datetime.datetime.today().strftime(_DATE_FMT)
 
     row_str = ' | '.join((
         description,
@@ -220,9 +242,8 @@ def main():
     )
 
     keep = '\n'.join(lines[:args.skip_lines])
-    table_str = '\n'.join(lines[args.skip_lines:])
 
-    table = MarkDownTable.genfromtxt(table_str)
+    table = MarkDownTable.genfromtxt_lines(lines[args.skip_lines:])
     log.debug(f'Parsed table\n    {table!r}')
 
     if args.command == 'create':
@@ -271,9 +292,7 @@ def main():
             status=args.status
         )
 
-    table_str = table.to_text()
-
-    write_file(args.file, f'{keep}\n{table_str}')
+    write_file(args.file, keep, table)
 
     if args.command == 'create':
         print('\nCreated User Story successsully!')